@@ -0,0 +1,3 @@
+from .core import HTMLCompiler, HTMLErrorCorrector, main
+
+__all__ = ['HTMLCompiler', 'HTMLErrorCorrector', 'main']
@@ -0,0 +1,430 @@
+import streamlit as st
+import functools
+import io
+import tempfile
+import threading
+import webbrowser
+import os
+import pathlib
+
+from .patterns import TAG_RE, FMT_TAG_RE
+
+# HTML void elements never take a closing tag, with or without a trailing slash.
+_VOID_TAGS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr',
+})
+
+# Error kinds recorded by the parser, and the message template for each. The
+# templates are filled in from the recorded tag names only when the errors
+# are read.
+_ORPHAN_CLOSE, _MISMATCH, _MISSING_CLOSE = range(3)
+_ERROR_MESSAGES = (
+    "Closing tag </{0}> without opening tag",
+    "Mismatched tags: expected </{0}>, got </{1}>",
+    "Missing closing tag for <{0}>",
+)
+
+
+def _error_dict(line, kind, tags):
+    """Build the {'line', 'type', 'message'} dict for one recorded error."""
+    return {
+        'line': line,
+        'type': 'error',
+        'message': _ERROR_MESSAGES[kind].format(*tags)
+    }
+
+
+def _iter_tags(html_content):
+    """
+    Iterate TAG_RE matches, scanning no further than the last '>'.
+    Every tag ends in '>', and bounding the search keeps re's backtracking
+    linear on input with many '<' and no closing '>' after them.
+    """
+    return TAG_RE.finditer(html_content, 0, html_content.rfind('>') + 1)
+
+
+class HTMLErrorCorrector:
+    __slots__ = (
+        '_err_lines', '_err_kinds', '_err_tags', 'corrected_html',
+        'tag_stack', 'line_number', '_html', '_line_offset', '_output',
+    )
+
+    def __init__(self):
+        # Errors are stored column-wise: one line, kind and tag-name tuple per error.
+        self._err_lines = []
+        self._err_kinds = []
+        self._err_tags = []
+        self.corrected_html = io.StringIO()
+        self.tag_stack = []
+        self.line_number = 1
+        self._html = ''
+        self._line_offset = 0
+        self._output = ''
+
+    def reset(self):
+        """Clear all parse state so the instance can be reused for new input."""
+        self._err_lines.clear()
+        self._err_kinds.clear()
+        self._err_tags.clear()
+        self.corrected_html.seek(0)
+        self.corrected_html.truncate()
+        self.tag_stack.clear()
+        self.line_number = 1
+        self._html = ''
+        self._line_offset = 0
+        self._output = ''
+
+    @property
+    def errors(self):
+        """The recorded errors as a list of {'line', 'type', 'message'} dicts."""
+        return [_error_dict(*record) for record in self.error_records()]
+
+    def error_records(self):
+        """The recorded errors as immutable (line, kind, tag names) tuples."""
+        return tuple(zip(self._err_lines, self._err_kinds, self._err_tags))
+
+    def _add_error(self, kind, *tags):
+        self._err_lines.append(self.line_number)
+        self._err_kinds.append(kind)
+        self._err_tags.append(tags)
+
+    def _advance_line(self, offset):
+        """
+        Move line_number forward to the line containing offset in the parsed
+        input. Errors are recorded in input order, so only the newlines since
+        the previous call are counted.
+        """
+        self.line_number += self._html.count('\n', self._line_offset, offset)
+        self._line_offset = offset
+
+    def parse(self, html_content):
+        """
+        Parse HTML content using regular expressions to find tags,
+        report mismatches and missing closing tags, and auto-correct the HTML.
+        """
+        # Most input is already well-formed: a check-only pass finds that out
+        # without the stack bookkeeping, and the input is then the output. Only
+        # a reference to it is kept, never a copy.
+        if self.is_well_formed(html_content):
+            self._output = html_content
+            return html_content
+        self._html = html_content
+        self._line_offset = 0
+
+        # The corrected output is the input with closing tags inserted at a few
+        # offsets, so the loop only validates tags and copies the input through
+        # up to each insertion point; `pos` is the end of the last copied span.
+        pos = 0
+        # Bind hot attribute lookups to locals for the tag loop.
+        _write = self.corrected_html.write
+        tag_stack = self.tag_stack
+        _push = tag_stack.append
+        _pop = tag_stack.pop
+
+        for match in _iter_tags(html_content):
+            close_name, tag_name, rest = match.groups()
+
+            # Check if it's a void or self-closing tag (e.g. <br>, <img ... />)
+            if close_name is None:
+                if not (tag_name.lower() in _VOID_TAGS or rest.rstrip().endswith('/')):
+                    # Start tag: push onto the stack.
+                    _push(tag_name)
+            else:
+                # End tag encountered.
+                tag_name = close_name
+                if tag_name.lower() in _VOID_TAGS:
+                    # A void element's closing tag (e.g. </br>) never matches a
+                    # start tag on the stack; pass it through unchanged.
+                    continue
+                if not tag_stack:
+                    # No matching opening tag.
+                    start = match.start()
+                    self._advance_line(start)
+                    self._add_error(_ORPHAN_CLOSE, tag_name)
+                else:
+                    last_tag = tag_stack[-1]
+                    if last_tag != tag_name:
+                        # Mismatched closing tag.
+                        start = match.start()
+                        self._advance_line(start)
+                        self._add_error(_MISMATCH, last_tag, tag_name)
+                        # Auto-correct: close the last tag properly before adding the current one.
+                        _write(html_content[pos:start])
+                        _write(f"</{last_tag}>")
+                        pos = start
+                    _pop()
+
+        # Copy the rest of the input after the last insertion point.
+        _write(html_content[pos:])
+
+        # Close any unclosed tags, reporting them at the line of the last tag.
+        if tag_stack:
+            self._advance_line(match.start())
+        while tag_stack:
+            tag = _pop()
+            _write(f"</{tag}>")
+            self._add_error(_MISSING_CLOSE, tag)
+
+        # Keep only the finished string: drop the input reference and empty
+        # the scratch buffer so the parser holds no second copy between calls.
+        self._output = self.corrected_html.getvalue()
+        self.corrected_html.seek(0)
+        self.corrected_html.truncate()
+        self._html = ''
+        return self._output
+
+    @staticmethod
+    def is_well_formed(html_content):
+        """
+        Walk the tags without building corrected output and report whether
+        parse() would record any errors. Stops at the first violation.
+        """
+        stack = []
+        for match in _iter_tags(html_content):
+            close_name, tag_name, rest = match.groups()
+            if close_name is None:
+                if not (tag_name.lower() in _VOID_TAGS or rest.rstrip().endswith('/')):
+                    stack.append(tag_name)
+            elif close_name.lower() in _VOID_TAGS:
+                continue
+            elif not stack or stack.pop() != close_name:
+                return False
+        return not stack
+
+    def get_corrected_html(self):
+        return self._output
+
+
+class HTMLCompiler:
+    def __init__(self):
+        self.parser = HTMLErrorCorrector()
+        # Results are pure functions of the input string, so repeated calls
+        # with unchanged HTML are served from these per-instance caches.
+        self._compile_cached = functools.lru_cache(maxsize=32)(self._compile)
+        self._validate_cached = functools.lru_cache(maxsize=32)(HTMLErrorCorrector.is_well_formed)
+        self._format_cached = functools.lru_cache(maxsize=32)(self._format_html)
+
+    def clear_cache(self):
+        """Drop all memoized compile, validate and format results."""
+        self._compile_cached.cache_clear()
+        self._validate_cached.cache_clear()
+        self._format_cached.cache_clear()
+
+    def compile(self, html_content):
+        """Compile HTML content and return corrected version with error report."""
+        corrected, records = self._compile_cached(html_content)
+        # The cache holds immutable records; each caller gets fresh dicts.
+        return {
+            'corrected_html': corrected,
+            'errors': [_error_dict(*record) for record in records]
+        }
+
+    def _compile(self, html_content):
+        self.parser.reset()
+        corrected = self.parser.parse(html_content)
+        return corrected, self.parser.error_records()
+
+    def validate_html(self, html_content):
+        """
+        Very basic validation: check whether compiling would record any errors.
+        """
+        return self._validate_cached(html_content)
+
+    def format_html(self, html_content):
+        """
+        Format HTML content with simple indentation.
+        This splits the HTML into tags and data and indents nested tags.
+        """
+        return self._format_cached(html_content)
+
+    def _format_html(self, html_content):
+        indent = 0
+        formatted_lines = []
+
+        def add_text(text):
+            # For text content, split by newline if necessary
+            for line in text.splitlines():
+                line = line.strip()
+                if line:
+                    formatted_lines.append("    " * indent + line)
+
+        # Classify each tag from its own characters in a single pass, rather
+        # than re-matching it against separate closing/opening patterns.
+        pos = 0
+        for match in FMT_TAG_RE.finditer(html_content, 0, html_content.rfind('>') + 1):
+            add_text(html_content[pos:match.start()])
+            pos = match.end()
+            tag = match.group()
+            inner = tag[1:].lstrip()
+            if inner[0] == '/':
+                # Closing tag: decrease indent before writing it, unless it
+                # closes a void element that never increased it.
+                closing = inner[1:-1].split(None, 1)
+                if not closing or closing[0].lower() not in _VOID_TAGS:
+                    indent = max(indent - 1, 0)
+                formatted_lines.append("    " * indent + tag)
+            else:
+                formatted_lines.append("    " * indent + tag)
+                # Increase indent after an opening tag that is not void or self-closing.
+                if (inner[0].isalnum() or inner[0] == '_') and not tag.endswith('/>'):
+                    tag_name = inner[:-1].split(None, 1)[0].split('/', 1)[0]
+                    if tag_name.lower() not in _VOID_TAGS:
+                        indent += 1
+        add_text(html_content[pos:])
+        return "\n".join(formatted_lines)
+
+
+def _errors_markdown(errors):
+    """Render errors as one markdown list so they can be shown in a single element."""
+    return "\n".join(f"- Line {error['line']}: {error['message']}" for error in errors)
+
+
+def main():
+    st.set_page_config(
+        page_title="HTML Compiler",
+        page_icon="🔧",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+
+    # Custom CSS
+    st.markdown("""
+        <style>
+        .stTextArea {
+            font-family: 'Consolas', monospace;
+        }
+        .error-message {
+            color: #dc2626;
+            background-color: #fee2e2;
+            padding: 1rem;
+            border-radius: 0.5rem;
+            margin: 1rem 0;
+        }
+        .success-message {
+            color: #059669;
+            background-color: #d1fae5;
+            padding: 1rem;
+            border-radius: 0.5rem;
+            margin: 1rem 0;
+        }
+        .error-count {
+            color: #dc2626;
+            font-weight: bold;
+        }
+        </style>
+    """, unsafe_allow_html=True)
+
+    st.title("HTML Compiler")
+    st.markdown("Validate, format, and correct your HTML code")
+
+    # Keep one compiler per session so its result caches survive reruns.
+    if 'compiler' not in st.session_state:
+        st.session_state.compiler = HTMLCompiler()
+    compiler = st.session_state.compiler
+
+    # Default HTML template
+    default_html = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Sample HTML</title>
+</head>
+<body>
+    <h1>Welcome to HTML Compiler</h1>
+    <p>Start editing your HTML code here!</p>
+</body>
+</html>"""
+
+    # Initialize session state
+    if 'input' not in st.session_state:
+        st.session_state.input = default_html
+    if 'compiled' not in st.session_state:
+        st.session_state.compiled = False
+
+    # Output and errors are not kept in session state; they are looked up from
+    # the compiler's cache for the last compiled input on each rerun.
+    if st.session_state.compiled:
+        result = compiler.compile(st.session_state.input)
+        output, errors = result['corrected_html'], result['errors']
+    else:
+        output, errors = "", []
+
+    # Create two columns for input and output
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("Input HTML")
+        input_html = st.text_area(
+            "Enter your HTML code",
+            value=st.session_state.input,
+            height=400,
+            key="input_area"
+        )
+
+    with col2:
+        st.subheader("Output HTML")
+        st.text_area(
+            "Compiled HTML",
+            value=output,
+            height=400,
+            key="output_area",
+            disabled=True
+        )
+
+    # Buttons row
+    col3, col4, col5 = st.columns(3)
+
+    with col3:
+        if st.button("Compile HTML", type="primary"):
+            with st.spinner("Compiling..."):
+                result = compiler.compile(input_html)
+                st.session_state.input = input_html
+                st.session_state.compiled = True
+
+                if result['errors']:
+                    st.error(
+                        f"Found {len(result['errors'])} HTML errors:\n\n"
+                        + _errors_markdown(result['errors'])
+                    )
+                else:
+                    st.success("HTML compiled successfully!")
+                st.rerun()
+
+    with col4:
+        if st.button("Preview in Browser"):
+            if output:
+                # Reuse one preview file per session and rewrite it only when the
+                # output has changed. The hash is recorded only after a successful
+                # write; only the browser launch runs off the script thread.
+                if 'preview_path' not in st.session_state:
+                    fd, temp_path = tempfile.mkstemp(suffix='.html')
+                    os.close(fd)
+                    st.session_state.preview_path = pathlib.Path(temp_path)
+                    st.session_state.preview_hash = None
+                output_hash = hash(output)
+                if output_hash != st.session_state.preview_hash:
+                    st.session_state.preview_path.write_text(output, encoding='utf-8')
+                    st.session_state.preview_hash = output_hash
+                threading.Thread(
+                    target=webbrowser.open,
+                    args=(st.session_state.preview_path.as_uri(),),
+                    daemon=True
+                ).start()
+            else:
+                st.warning("Please compile HTML first!")
+
+    with col5:
+        if st.button("Clear All"):
+            st.session_state.input = default_html
+            st.session_state.compiled = False
+            compiler.clear_cache()
+            st.rerun()
+
+    # Display errors in a separate section
+    if errors:
+        st.markdown("### Error Details")
+        st.error(_errors_markdown(errors))
+
+    # Footer
+    st.markdown("---")
+    st.markdown("Made with ❤️ by Nakul Makode, Vedant Kohad, Yogeshwar Tiwari")
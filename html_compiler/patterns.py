@@ -0,0 +1,10 @@
+"""Compiled regular expressions shared by the HTML compiler."""
+import re
+
+# Patterns are compiled once per process, when this module is first imported.
+# TAG_RE matches either a closing tag (name in group 1) or a start tag (name
+# in group 2, attributes or self-closing slash in group 3); exactly one of the
+# two name groups is set per match.
+TAG_RE = re.compile(r'<\s*(?:/(\w+)[^>]*|(\w+)([^>]*))>')
+# Any tag-like token, as used for indentation by format_html.
+FMT_TAG_RE = re.compile(r'<[^>]+>')
@@ -0,0 +1,4 @@
+from html_compiler.core import main
+
+if __name__ == "__main__":
+    main()
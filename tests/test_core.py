@@ -0,0 +1,70 @@
+import unittest
+
+from html_compiler import HTMLCompiler, HTMLErrorCorrector
+
+
+class VoidElementTests(unittest.TestCase):
+    def setUp(self):
+        self.compiler = HTMLCompiler()
+
+    def test_void_start_tags_need_no_closing_tag(self):
+        html = '<p>a<br>b<img src=x><INPUT type=text></p>'
+        result = self.compiler.compile(html)
+        self.assertEqual(result['corrected_html'], html)
+        self.assertEqual(result['errors'], [])
+        self.assertTrue(self.compiler.validate_html(html))
+
+    def test_explicit_void_closing_tags_pass_through(self):
+        for html in ('<div><img src=x></img></div>', '<br></br>', '<p><BR></br></p>'):
+            with self.subTest(html=html):
+                result = self.compiler.compile(html)
+                self.assertEqual(result['corrected_html'], html)
+                self.assertEqual(result['errors'], [])
+                self.assertTrue(self.compiler.validate_html(html))
+
+    def test_void_closing_tag_does_not_dedent(self):
+        self.assertEqual(
+            self.compiler.format_html('<div><br></br><p>x</p></div>'),
+            '<div>\n    <br>\n    </br>\n    <p>\n        x\n    </p>\n</div>'
+        )
+
+
+class CompileCacheTests(unittest.TestCase):
+    def test_mutating_a_result_does_not_change_the_cached_entry(self):
+        compiler = HTMLCompiler()
+        first = compiler.compile('<div>')
+        first['errors'][0]['line'] = 99
+        first['errors'].append({})
+        second = compiler.compile('<div>')
+        self.assertEqual(second['errors'], [
+            {'line': 1, 'type': 'error', 'message': 'Missing closing tag for <div>'}
+        ])
+
+
+class LineNumberTests(unittest.TestCase):
+    def lines(self, html):
+        return [error['line'] for error in HTMLCompiler().compile(html)['errors']]
+
+    def test_lines_count_newlines_in_text(self):
+        self.assertEqual(self.lines('<div>\n<p>a\n</div>\n</span>'), [3, 4])
+
+    def test_lines_count_newlines_inside_tags(self):
+        # Newlines inside a multi-line tag move later errors to their real
+        # source line.
+        self.assertEqual(self.lines('<div\nclass=a>\n</p>'), [3])
+        self.assertEqual(self.lines('<p\n\n>x</b>'), [3])
+
+
+class ParserStateTests(unittest.TestCase):
+    def test_parser_keeps_only_the_output_after_parse(self):
+        parser = HTMLErrorCorrector()
+        for html, expected in (('<p>ok</p>', '<p>ok</p>'), ('<p>ok', '<p>ok</p>')):
+            with self.subTest(html=html):
+                parser.reset()
+                self.assertEqual(parser.parse(html), expected)
+                self.assertEqual(parser.get_corrected_html(), expected)
+                self.assertEqual(parser.corrected_html.getvalue(), '')
+
+
+if __name__ == '__main__':
+    unittest.main()